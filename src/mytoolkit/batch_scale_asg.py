@@ -12,6 +12,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from rich.panel import Panel
 from mytoolkit.utils import get_logger, echo_error, echo_info
+from mytoolkit.plan_model import CapacitySpec, PlanEntry, validate_plan
 
 app = typer.Typer(add_completion=True)
 console = Console()
@@ -37,6 +38,7 @@ def batch_scale_asg(
     模板示例:
       [
         {
+          "schema_version": 2,
           "ec2_name": "nginx",
           "asg_name": "nginx-xx-asg-1",
           "created": "...",
@@ -45,6 +47,7 @@ def batch_scale_asg(
         },
         ...
       ]
+    旧版模板 (current/target 使用 n/d/x 字段) 会在加载时自动迁移。
     """
     logger = get_logger("batch-scale-asg")
 
@@ -139,13 +142,11 @@ def batch_scale_asg(
             cd = detail["DesiredCapacity"]
             mn = detail["MinSize"]
             mx = detail["MaxSize"]
-            template_list.append({
-                "ec2_name": ec2,
-                "asg_name": asg,
-                "created": created,
-                "current": {"desired": cd, "min": mn, "max": mx},
-                "target": {"desired": cd, "min": mn, "max": mx}
-            })
+            template_list.append(PlanEntry(
+                ec2, asg, created,
+                current=CapacitySpec(mn, cd, mx),
+                target=CapacitySpec(mn, cd, mx),
+            ).to_dict())
 
         if not template_list:
             console.print("[bold red]⚠️ 无可用 ASG 模板，已退出[/bold red]")
@@ -181,39 +182,15 @@ def batch_scale_asg(
     except Exception as e:
         echo_error(f"解析 JSON 失败：{e}")
         raise typer.Exit(1)
-    if not isinstance(plan, list) or not plan:
-        echo_error("JSON 必须是非空数组 (list)")
-        raise typer.Exit(1)
 
-    # 2.b 校验计划项格式和逻辑
-    seen = set()
-    for idx, entry in enumerate(plan, start=1):
-        ec2 = entry.get("ec2_name")
-        asg = entry.get("asg_name")
-        if not ec2 or not isinstance(ec2, str):
-            echo_error(f"第 {idx} 项：ec2_name 无效")
-            raise typer.Exit(1)
-        if not asg or not isinstance(asg, str):
-            echo_error(f"第 {idx} 项：asg_name 无效")
-            raise typer.Exit(1)
-        if asg in seen:
-            echo_error(f"第 {idx} 项：asg_name '{asg}' 重复")
-            raise typer.Exit(1)
-        seen.add(asg)
-        for blk_name in ("current", "target"):
-            blk = entry.get(blk_name)
-            if not isinstance(blk, dict) or not all(k in blk for k in ("min", "desired", "max")):
-                echo_error(f"第 {idx} 项：'{blk_name}' 必须包含 n, d, x")
-                raise typer.Exit(1)
-            if not all((blk[k] is None or isinstance(blk[k], int)) for k in blk):
-                echo_error(f"第 {idx} 项：'{blk_name}' 值必须为整数或 null")
-                raise typer.Exit(1)
-        tmin, td, tmax = entry["target"]["min"], entry["target"]["desired"], entry["target"]["max"]
-        if not (tmin <= td <= tmax):
-            echo_error(
-                f"第 {idx} 项：目标配置不合法 (desired={td}, min={tmin}, max={tmax})，需满足 n ≤ d ≤ x"
-            )
-            raise typer.Exit(1)
+    # 2.b 一次性校验全部计划项 (旧版模板自动迁移)，汇总输出所有错误
+    plan, errors = validate_plan(plan)
+    if errors:
+        for msg in errors:
+            echo_error(msg)
+        echo_error(f"计划校验失败：共 {len(errors)} 处错误")
+        logger.info(f"Plan validation failed with {len(errors)} errors")
+        raise typer.Exit(1)
 
     # 3. 展示 & 确认
     table = Table(title="批量缩放计划预览", header_style="bold magenta")
@@ -223,9 +200,10 @@ def batch_scale_asg(
     table.add_column("current[desired/min/max]", justify="center")
     table.add_column("target [desired/min/max]", justify="center")
     for idx, entry in enumerate(plan, start=1):
-        curr = f"{entry['current']['desired']}/{entry['current']['min']}/{entry['current']['max']}"
-        targ = f"{entry['target']['desired']}/{entry['target']['min']}/{entry['target']['max']}"
-        table.add_row(str(idx), entry["ec2_name"], entry["asg_name"], curr, targ)
+        table.add_row(
+            str(idx), entry.ec2_name, entry.asg_name,
+            entry.current.fmt(), entry.target.fmt()
+        )
     console.print(table)
     if not Confirm.ask("确认执行以上批量缩放计划？", default=False):
         console.print("[bold red]操作已取消[/bold red]")
@@ -233,21 +211,21 @@ def batch_scale_asg(
 
     # 4. 遍历执行，每项单独确认
     for entry in plan:
-        ec2 = entry["ec2_name"]
-        asg = entry["asg_name"]
+        ec2 = entry.ec2_name
+        asg = entry.asg_name
         resp = asg_cli.describe_auto_scaling_groups(AutoScalingGroupNames=[asg])
         groups = resp.get("AutoScalingGroups", [])
         if not groups:
             console.print(f"[yellow]⚠️ ASG '{asg}' 未找到，已跳过更新[/yellow]")
-            entry["status"] = "skipped"
+            entry.status = "skipped"
             continue
         detail = groups[0]
         cd, mn, mx = detail["DesiredCapacity"], detail["MinSize"], detail["MaxSize"]
-        td, tmin, tmax = entry["target"]["desired"], entry["target"]["min"], entry["target"]["max"]
+        td, tmin, tmax = entry.target.desired, entry.target.min, entry.target.max
 
         if cd == td and mn == tmin and mx == tmax:
             console.print(f"[yellow]ASG {asg}: 当前与目标一致，跳过[/yellow]")
-            entry["status"] = "skipped"
+            entry.status = "skipped"
             continue
 
         info = (
@@ -258,7 +236,7 @@ def batch_scale_asg(
         console.print(Panel(info, title="单条确认", border_style="cyan"))
         if not Confirm.ask(f"确认更新 {asg}?", default=False):
             console.print(f"[yellow]已跳过 {asg}[/yellow]")
-            entry["status"] = "skipped"
+            entry.status = "skipped"
             continue
 
         with Progress(SpinnerColumn(), TextColumn("{task.description}")) as prog:
@@ -272,9 +250,9 @@ def batch_scale_asg(
             prog.update(task, description="更新完成", completed=1)
 
         console.print(f"[bold green]✅ {asg} 更新完成[/bold green]")
-        entry["status"] = "updated"
-        entry["updated_by"] = user_arn
-        entry["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        entry.status = "updated"
+        entry.updated_by = user_arn
+        entry.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # 5. 写回结果到 logs 目录
     log_dir = os.path.join(os.getcwd(), "logs", "batch-scale-asg")
@@ -284,7 +262,7 @@ def batch_scale_asg(
         f"batch_scale_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     )
     with open(result_path, "w", encoding="utf-8") as f:
-        json.dump(plan, f, indent=2, ensure_ascii=False)
+        json.dump([entry.to_dict() for entry in plan], f, indent=2, ensure_ascii=False)
 
     echo_info(f"✅ 批量缩放结果已保存：{result_path}")
     logger.info(f"Batch scale result written to {result_path}")
@@ -5,11 +5,16 @@ import os
 import json
 import boto3
 import typer
+from datetime import datetime
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from mytoolkit.utils import get_logger, echo_error, echo_info
+from mytoolkit.inventory_export import (
+    EXPORT_FORMATS, export_inventory, iter_inventory, load_asg_capacity,
+    pyarrow_available,
+)
 
 app = typer.Typer(add_completion=True)
 console = Console()
@@ -27,12 +32,21 @@ def discover_asg(
     region: str = typer.Option(
         None, "--region", "-r",
         help="AWS 区域 (例如 ap-east-1, cn-northwest-1)"
-    )
+    ),
+    export: bool = typer.Option(
+        False, "--export", "-e",
+        help="导出区域内全部实例清单 (实例/ASG/AZ/类型/状态/启动时间/容量)"
+    ),
+    export_format: str = typer.Option(
+        "csv", "--format", "-f",
+        help="导出格式：csv / parquet / arrow (后两者需安装 pyarrow)"
+    ),
 ):
     """
     批量根据模糊的 EC2 Name（即服务名）列表发现对应的 ASG 名称，
     输入 JSON 格式: [{"ec2_name": "ng"}, {"ec2_name": "example"}]
     输出 JSON 格式: [{"ec2_name":"ng","asg_name":"nginx-xx-asg"}, ...]
+    --export 模式: 分块流式导出完整实例清单到 asg_inventory_<timestamp>.<format>
     """
     logger = get_logger("discover-asg")
 
@@ -45,6 +59,15 @@ def discover_asg(
         region = "ap-east-1" if choice == "1" else "cn-northwest-1"
     logger.info(f"使用区域: {region}")
 
+    if export:
+        export_format = export_format.lower()
+        if export_format not in EXPORT_FORMATS:
+            echo_error(f"不支持的导出格式：{export_format} (可选 {', '.join(EXPORT_FORMATS)})")
+            raise typer.Exit(1)
+        if export_format != "csv" and not pyarrow_available():
+            echo_error(f"导出 {export_format} 需要安装 pyarrow：pip install pyarrow")
+            raise typer.Exit(1)
+
     session = boto3.session.Session(region_name=region)
     ec2 = session.client("ec2")
 
@@ -63,6 +86,22 @@ def discover_asg(
         logger.info(f"Generated template at {template_path}")
         raise typer.Exit()
 
+    # 1.b 导出实例清单
+    if export:
+        out_path = os.path.join(
+            os.getcwd(),
+            f"asg_inventory_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        )
+        with Progress(SpinnerColumn(), TextColumn("{task.description}")) as progress:
+            task = progress.add_task("查询 ASG 容量...", total=None)
+            capacity = load_asg_capacity(session.client("autoscaling"))
+            progress.update(task, description="导出实例清单...")
+            total = export_inventory(iter_inventory(ec2, capacity), out_path, export_format)
+            progress.update(task, description="导出完成", completed=1)
+        echo_info(f"✅ 实例清单已导出 ({total} 条)：{out_path}")
+        logger.info(f"Exported {total} inventory rows ({export_format}) to {out_path}")
+        raise typer.Exit()
+
     # 2. 获取并验证输入 JSON 路径
     while not input_json:
         input_json = Prompt.ask("请输入服务关键词 JSON 文件路径")
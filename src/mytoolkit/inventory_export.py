@@ -0,0 +1,128 @@
+# src/mytoolkit/inventory_export.py
+
+"""
+EC2 / ASG 实例清单导出。
+
+按页流式拉取 describe_instances，与 ASG 容量信息关联后分块写出，
+内存占用只与分块大小和 ASG 数量有关，与实例总数无关。
+CSV 使用标准库；Parquet / Arrow 需要额外安装 pyarrow。
+"""
+
+import csv
+import importlib.util
+
+EXPORT_FORMATS = ("csv", "parquet", "arrow")
+DEFAULT_CHUNK_SIZE = 1000
+
+COLUMNS = (
+    "instance_id", "ec2_name", "asg_name", "availability_zone",
+    "instance_type", "state", "launch_time",
+    "asg_min", "asg_desired", "asg_max",
+)
+
+
+def pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def load_asg_capacity(asg_cli) -> dict:
+    """asg_name → (min, desired, max)"""
+    capacity = {}
+    for page in asg_cli.get_paginator("describe_auto_scaling_groups").paginate():
+        for grp in page.get("AutoScalingGroups", []):
+            capacity[grp["AutoScalingGroupName"]] = (
+                grp["MinSize"], grp["DesiredCapacity"], grp["MaxSize"]
+            )
+    return capacity
+
+
+def iter_inventory(ec2_cli, asg_capacity: dict):
+    """逐条生成实例清单行 (dict)，ASG 归属取自 aws:autoscaling:groupName 标签"""
+    for page in ec2_cli.get_paginator("describe_instances").paginate():
+        for r in page.get("Reservations", []):
+            for ins in r.get("Instances", []):
+                tags = {t["Key"]: t["Value"] for t in ins.get("Tags", [])}
+                asg = tags.get("aws:autoscaling:groupName")
+                mn, cd, mx = asg_capacity.get(asg, (None, None, None))
+                yield {
+                    "instance_id": ins["InstanceId"],
+                    "ec2_name": tags.get("Name"),
+                    "asg_name": asg,
+                    "availability_zone": ins.get("Placement", {}).get("AvailabilityZone"),
+                    "instance_type": ins.get("InstanceType"),
+                    "state": ins.get("State", {}).get("Name"),
+                    "launch_time": ins.get("LaunchTime"),
+                    "asg_min": mn,
+                    "asg_desired": cd,
+                    "asg_max": mx,
+                }
+
+
+def _chunks(rows, size: int):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _write_csv(rows, out_path: str, chunk_size: int) -> int:
+    total = 0
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        for chunk in _chunks(rows, chunk_size):
+            for row in chunk:
+                lt = row["launch_time"]
+                if lt is not None:
+                    row["launch_time"] = lt.isoformat()
+            writer.writerows(chunk)
+            total += len(chunk)
+    return total
+
+
+def _write_pyarrow(rows, out_path: str, chunk_size: int, fmt: str) -> int:
+    import pyarrow as pa
+
+    schema = pa.schema([
+        ("instance_id", pa.string()),
+        ("ec2_name", pa.string()),
+        ("asg_name", pa.string()),
+        ("availability_zone", pa.string()),
+        ("instance_type", pa.string()),
+        ("state", pa.string()),
+        ("launch_time", pa.timestamp("us", tz="UTC")),
+        ("asg_min", pa.int32()),
+        ("asg_desired", pa.int32()),
+        ("asg_max", pa.int32()),
+    ])
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(out_path, schema)
+    else:
+        writer = pa.ipc.new_file(out_path, schema)
+
+    total = 0
+    try:
+        for chunk in _chunks(rows, chunk_size):
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            total += len(chunk)
+    finally:
+        writer.close()
+    return total
+
+
+def export_inventory(rows, out_path: str, fmt: str = "csv",
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    将实例清单分块写入 out_path，返回写出的行数。
+    fmt 为 parquet/arrow 且未安装 pyarrow 时抛出 ImportError。
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"不支持的导出格式：{fmt}")
+    if fmt == "csv":
+        return _write_csv(rows, out_path, chunk_size)
+    return _write_pyarrow(rows, out_path, chunk_size, fmt)
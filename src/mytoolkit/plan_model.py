@@ -0,0 +1,171 @@
+# src/mytoolkit/plan_model.py
+
+"""
+批量缩放计划的数据模型与校验。
+
+- CapacitySpec / PlanEntry 使用 __slots__，大计划 (上千条) 内存占用更小
+- validate_plan 单次遍历收集全部错误，而不是遇到第一个错误就退出
+- 旧版模板 (n/d/x 字段、以 ec2_name 为键的字典) 在加载时自动迁移到当前版本
+"""
+
+PLAN_SCHEMA_VERSION = 2
+
+# 旧版模板字段 → 当前字段
+_LEGACY_CAPACITY_KEYS = {"n": "min", "d": "desired", "x": "max"}
+_CAPACITY_KEYS = ("min", "desired", "max")
+
+
+class CapacitySpec:
+    """一组 ASG 容量配置 (min/desired/max)"""
+
+    __slots__ = ("min", "desired", "max")
+
+    def __init__(self, min, desired, max):
+        self.min = min
+        self.desired = desired
+        self.max = max
+
+    def to_dict(self) -> dict:
+        return {"desired": self.desired, "min": self.min, "max": self.max}
+
+    def fmt(self) -> str:
+        """按 desired/min/max 顺序格式化，用于预览表格"""
+        return f"{self.desired}/{self.min}/{self.max}"
+
+
+class PlanEntry:
+    """批量缩放计划中的一项"""
+
+    __slots__ = (
+        "schema_version", "ec2_name", "asg_name", "created",
+        "current", "target", "status", "updated_by", "updated_at",
+    )
+
+    def __init__(self, ec2_name, asg_name, created, current, target,
+                 schema_version=PLAN_SCHEMA_VERSION):
+        self.schema_version = schema_version
+        self.ec2_name = ec2_name
+        self.asg_name = asg_name
+        self.created = created
+        self.current = current
+        self.target = target
+        self.status = None
+        self.updated_by = None
+        self.updated_at = None
+
+    def to_dict(self) -> dict:
+        data = {
+            "schema_version": self.schema_version,
+            "ec2_name": self.ec2_name,
+            "asg_name": self.asg_name,
+            "created": self.created,
+            "current": self.current.to_dict(),
+            "target": self.target.to_dict(),
+        }
+        for key in ("status", "updated_by", "updated_at"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
+
+
+def _is_int(value) -> bool:
+    # bool 是 int 的子类，这里需要排除
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def migrate_entry(entry: dict) -> dict:
+    """
+    将单条计划项迁移到当前 schema 版本 (返回新字典，不修改入参)。
+      - v1: current/target 使用 n/d/x 字段
+      - v2: current/target 使用 min/desired/max 字段，并带 schema_version
+    """
+    migrated = dict(entry)
+    for blk_name in ("current", "target"):
+        blk = migrated.get(blk_name)
+        if isinstance(blk, dict) and any(k in blk for k in _LEGACY_CAPACITY_KEYS):
+            migrated[blk_name] = {
+                _LEGACY_CAPACITY_KEYS.get(k, k): v for k, v in blk.items()
+            }
+    migrated["schema_version"] = PLAN_SCHEMA_VERSION
+    return migrated
+
+
+def normalize_plan(raw) -> list:
+    """
+    统一顶层结构为列表：
+    旧版模板为 {"<ec2_name>": {...}} 形式的字典，转换为带 ec2_name 的列表。
+    """
+    if isinstance(raw, dict):
+        return [
+            {"ec2_name": ec2, **body} if isinstance(body, dict) else body
+            for ec2, body in raw.items()
+        ]
+    return raw
+
+
+def _check_capacity(blk_name: str, blk, allow_null: bool, errors: list, prefix: str):
+    if not isinstance(blk, dict) or not all(k in blk for k in _CAPACITY_KEYS):
+        errors.append(f"{prefix}'{blk_name}' 必须包含 min, desired, max")
+        return None
+    bad = [
+        k for k in _CAPACITY_KEYS
+        if not (_is_int(blk[k]) or (allow_null and blk[k] is None))
+    ]
+    if bad:
+        kind = "整数或 null" if allow_null else "整数"
+        errors.append(f"{prefix}'{blk_name}' 的 {', '.join(bad)} 必须为{kind}")
+        return None
+    return CapacitySpec(blk["min"], blk["desired"], blk["max"])
+
+
+def validate_plan(raw) -> tuple[list, list]:
+    """
+    单次遍历校验整个计划，返回 (entries, errors)：
+      - entries: 校验通过的 PlanEntry 列表
+      - errors : 所有错误信息 (为空表示计划合法)
+    """
+    plan = normalize_plan(raw)
+    if not isinstance(plan, list) or not plan:
+        return [], ["JSON 必须是非空数组 (list)"]
+
+    entries = []
+    errors = []
+    # asg_name → 首次出现的序号，用于重复检测
+    seen = {}
+    for idx, entry in enumerate(plan, start=1):
+        prefix = f"第 {idx} 项："
+        if not isinstance(entry, dict):
+            errors.append(f"{prefix}必须是 JSON 对象")
+            continue
+        version = entry.get("schema_version", 1)
+        if not _is_int(version) or version > PLAN_SCHEMA_VERSION:
+            errors.append(f"{prefix}不支持的 schema_version: {version}")
+            continue
+        if version < PLAN_SCHEMA_VERSION:
+            entry = migrate_entry(entry)
+
+        n_errors = len(errors)
+        ec2 = entry.get("ec2_name")
+        asg = entry.get("asg_name")
+        if not ec2 or not isinstance(ec2, str):
+            errors.append(f"{prefix}ec2_name 无效")
+        if not asg or not isinstance(asg, str):
+            errors.append(f"{prefix}asg_name 无效")
+        elif asg in seen:
+            errors.append(f"{prefix}asg_name '{asg}' 与第 {seen[asg]} 项重复")
+        else:
+            seen[asg] = idx
+
+        current = _check_capacity("current", entry.get("current"), True, errors, prefix)
+        target = _check_capacity("target", entry.get("target"), False, errors, prefix)
+        if target is not None and not (target.min <= target.desired <= target.max):
+            errors.append(
+                f"{prefix}目标配置不合法 (desired={target.desired}, min={target.min}, "
+                f"max={target.max})，需满足 min ≤ desired ≤ max"
+            )
+
+        if len(errors) == n_errors:
+            entries.append(PlanEntry(ec2, asg, entry.get("created"), current, target))
+
+    return entries, errors